@@ -13,6 +13,7 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
@@ -30,23 +31,34 @@ import utils
 
 from config.settings import (
     APP_TITLE,
+    ENABLED_SOURCES,
     REFRESH_INTERVAL_SECONDS,
-    SOURCES,
+    SCRAPER_MAX_WORKERS,
     SOURCES_BY_NAME,
 )
 from models.events import EventStore, NewsEvent
 import processing.categorizer
 import processing.geocoder
-from processing.deduplicator import deduplicate, deduplicate_against_existing
+from processing.deduplicator import deduplicate
 from processing.summarizer import generate_summary
 from scrapers import ALL_SCRAPERS
-from ui.dashboard_component import build_dashboard_html
+from ui.dashboard_component import MAP_MAX_AGE_HOURS, build_dashboard_html
 from ui.analytics_component import get_analytics_components
 from ui.styles import get_custom_css
 from utils.logger import get_logger
 
 logger = get_logger("app")
 
+# Source attribution is static – build the header/footer link lists once
+_HEADER_SOURCE_LINKS = " · ".join(
+    f'<a href="{s.website_url}" target="_blank" style="color:rgba(255,255,255,0.55);'
+    f'text-decoration:none;border-bottom:1px dotted rgba(255,255,255,0.25);">{s.name}</a>'
+    for s in ENABLED_SOURCES
+)
+_FOOTER_SOURCE_LINKS = " · ".join(
+    f"[{s.short_name}]({s.website_url})" for s in ENABLED_SOURCES
+)
+
 # ──────────────────────────────────────────────────────────────────────────
 # Page config (must be the first Streamlit command)
 # ──────────────────────────────────────────────────────────────────────────
@@ -96,8 +108,9 @@ st.markdown(
 if "event_store" not in st.session_state:
     st.session_state.event_store = EventStore()
 
+# Monotonic clock: immune to wall-clock jumps (NTP, container migration)
 if "last_refresh" not in st.session_state:
-    st.session_state.last_refresh = 0.0
+    st.session_state.last_refresh = float("-inf")
 
 if "scrape_errors" not in st.session_state:
     st.session_state.scrape_errors = []
@@ -107,6 +120,17 @@ if "scrape_errors" not in st.session_state:
 # Scraping logic
 # ──────────────────────────────────────────────────────────────────────────
 
+@st.cache_resource
+def _get_scraper_pool() -> ThreadPoolExecutor:
+    """Process-wide scraper thread pool, reused across refreshes and sessions."""
+    pool = ThreadPoolExecutor(
+        max_workers=SCRAPER_MAX_WORKERS,
+        thread_name_prefix="scraper",
+    )
+    atexit.register(pool.shutdown, wait=False, cancel_futures=True)
+    return pool
+
+
 def _run_all_scrapers() -> list[NewsEvent]:
     """Execute all scrapers in parallel and return merged, deduplicated events."""
     all_events: list[NewsEvent] = []
@@ -118,55 +142,118 @@ def _run_all_scrapers() -> list[NewsEvent]:
         if cls.SOURCE_NAME in SOURCES_BY_NAME and SOURCES_BY_NAME[cls.SOURCE_NAME].enabled
     ]
 
-    with ThreadPoolExecutor(max_workers=len(scrapers) or 1) as pool:
-        futures = {pool.submit(s.scrape): s for s in scrapers}
-        try:
-            for future in as_completed(futures, timeout=60):
-                scraper = futures[future]
-                try:
-                    events = future.result()
-                    all_events.extend(events)
-                    logger.info(
-                        "%s → %d events", scraper.SOURCE_NAME, len(events)
-                    )
-                except Exception as exc:
-                    errors.append(f"{scraper.SOURCE_NAME}: {exc}")
-                    logger.error("Scraper %s error: %s", scraper.SOURCE_NAME, exc)
-        except TimeoutError:
-            for future, scraper in futures.items():
-                if not future.done():
-                    future.cancel()
-                    errors.append(f"{scraper.SOURCE_NAME}: timed out")
-                    logger.warning("%s timed out", scraper.SOURCE_NAME)
-
+    pool = _get_scraper_pool()
+    futures = {pool.submit(s.scrape): s for s in scrapers}
+    try:
+        for future in as_completed(futures, timeout=60):
+            scraper = futures[future]
+            try:
+                events = future.result()
+                all_events.extend(events)
+                logger.info(
+                    "%s → %d events", scraper.SOURCE_NAME, len(events)
+                )
+            except Exception as exc:
+                errors.append(f"{scraper.SOURCE_NAME}: {exc}")
+                logger.error("Scraper %s error: %s", scraper.SOURCE_NAME, exc)
+    except TimeoutError:
+        # Running threads can't be cancelled; per-request HTTP timeouts make
+        # this a safety net, and stragglers simply finish in the background.
+        pending = [s for f, s in futures.items() if not f.done()]
+        for scraper in pending:
+            errors.append(f"{scraper.SOURCE_NAME}: timed out")
+        logger.warning(
+            "%d scraper(s) exceeded 60s: %s",
+            len(pending), ", ".join(s.SOURCE_NAME for s in pending),
+        )
+
+    # EventStore's seen-id set is the single source of truth for what is
+    # already stored; only the (small) new batch gets the fuzzy pass
+    store: EventStore = st.session_state.event_store
+    all_events = [ev for ev in all_events if not store.seen(ev.id)]
     all_events = deduplicate(all_events)
 
-    # Second pass: drop events that duplicate something already in the store
-    existing = st.session_state.event_store.get_all()
-    if existing:
-        all_events = deduplicate_against_existing(all_events, existing)
-
     st.session_state.scrape_errors = errors
     return all_events
 
 
-def _do_refresh() -> None:
-    """Fetch fresh data from all sources."""
+def _do_refresh() -> int:
+    """Fetch fresh data from all sources; returns the number of new events."""
     events = _run_all_scrapers()
     new_count = st.session_state.event_store.add_many(events)
-    st.session_state.last_refresh = time.time()
+    st.session_state.last_refresh = time.monotonic()
     logger.info(
         "Refresh complete: %d new events (total: %d)",
         new_count,
         st.session_state.event_store.count(),
     )
+    return new_count
+
+
+# ──────────────────────────────────────────────────────────────────────────
+# Rendering helpers
+# ──────────────────────────────────────────────────────────────────────────
+
+# Unchanged dashboards are re-sent verbatim (no iframe remount) for at most
+# this long, after which relative ages are re-rendered anyway
+_MAX_STALE_RENDER_SECONDS = 300
+
+def _event_fingerprint(events: list[NewsEvent]) -> tuple:
+    """Cheap, hashable cache key: the event-id set plus the current minute.
+
+    The minute bucket keeps the relative "N min ago" labels fresh while
+    letting reruns within the same minute reuse the rendered HTML.
+    """
+    return tuple(ev.id for ev in events), int(time.time() // 60)
+
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _cached_summary(fingerprint: tuple, _events: list[NewsEvent]) -> str:
+    """Situation summary for *_events*; reused while *fingerprint* is unchanged.
+
+    No ttl: the fingerprint's minute bucket already retires entries every
+    minute, which the summary's now-relative trend windows need anyway.
+    """
+    return generate_summary(_events)
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL_SECONDS, max_entries=4, show_spinner=False)
+def _cached_dashboard_html(
+    fingerprint: tuple,
+    summary_text: str,
+    _all_events: list[NewsEvent],
+    _geo_events: list[NewsEvent],
+) -> str:
+    """Build the map + feed HTML; reused while *fingerprint* is unchanged.
+
+    Underscore-prefixed arguments are excluded from Streamlit's cache key,
+    so only the fingerprint and summary are hashed.
+    """
+    # We pass the default desktop height explicitly so Streamlit doesn't render voids.
+    # For mobile screens, an overriding CSS selector inside ui/styles.py expands it.
+    return build_dashboard_html(
+        all_events=_all_events,
+        geo_events=_geo_events,
+        component_height=720,
+        summary_text=summary_text,
+    )
+
+
+@st.cache_data(ttl=REFRESH_INTERVAL_SECONDS, max_entries=4, show_spinner=False)
+def _cached_analytics(fingerprint: tuple, _events: list[NewsEvent]) -> dict:
+    """Analytics panels and trend chart; reused while *fingerprint* is unchanged.
+
+    The fingerprint's minute bucket bounds how stale the hourly buckets
+    and trend can get between reruns.
+    """
+    return get_analytics_components(_events)
 
 
 # ──────────────────────────────────────────────────────────────────────────
 # Initial data load
 # ──────────────────────────────────────────────────────────────────────────
 
-if st.session_state.last_refresh == 0.0:
+if st.session_state.last_refresh == float("-inf"):
     with st.spinner("Loading initial data from sources..."):
         _do_refresh()
 
@@ -181,8 +268,8 @@ st.markdown(
         <div>
             <h1 style="margin-bottom:2px;">{APP_TITLE}</h1>
             <div style="font-size:0.72rem;color:rgba(255,255,255,0.45);font-weight:400;letter-spacing:0.02em;line-height:1.5;">
-                Near real-time news aggregation from {len([s for s in SOURCES if s.enabled])} sources:
-                {' · '.join(f'<a href="{s.website_url}" target="_blank" style="color:rgba(255,255,255,0.55);text-decoration:none;border-bottom:1px dotted rgba(255,255,255,0.25);">{s.name}</a>' for s in SOURCES if s.enabled)}
+                Near real-time news aggregation from {len(ENABLED_SOURCES)} sources:
+                {_HEADER_SOURCE_LINKS}
                 <br/>Map shows last 72h · Data refreshes every ~60s · Hover a card to locate on map · Click filters to narrow view
             </div>
         </div>
@@ -205,28 +292,23 @@ st.markdown(
 def live_dashboard():
     """Fragment that auto-refreshes the map and news feed."""
 
-    elapsed = time.time() - st.session_state.last_refresh
+    new_count = 0
+    elapsed = time.monotonic() - st.session_state.last_refresh
     if elapsed >= REFRESH_INTERVAL_SECONDS:
-        _do_refresh()
+        new_count = _do_refresh()
 
     store: EventStore = st.session_state.event_store
     all_events = store.get_all()
     map_events = store.get_all(with_location_only=True)
 
-    now_utc = datetime.now(timezone.utc).strftime("%d/%m/%Y %H:%M:%S UTC")
+    now = datetime.now(timezone.utc)
+    now_utc = now.strftime("%d/%m/%Y %H:%M:%S UTC")
 
     # ── Status line ───────────────────────────────────────────────
-    from ui.dashboard_component import MAP_MAX_AGE_HOURS
-    now = datetime.now(timezone.utc)
-    recent_count = sum(
-        1 for ev in all_events
-        if ev.age_minutes(now) <= MAP_MAX_AGE_HOURS * 60
-    )
-    recent_geo_count = sum(
-        1 for ev in map_events
-        if ev.age_minutes(now) <= MAP_MAX_AGE_HOURS * 60
-    )
-    
+    cutoff = now.timestamp() - MAP_MAX_AGE_HOURS * 3600
+    recent_count = store.count_since(cutoff)
+    recent_geo_count = store.count_since(cutoff, with_location_only=True)
+
     st.markdown(
         f"""
         <div style="display:flex;align-items:center;justify-content:space-between;
@@ -245,17 +327,29 @@ def live_dashboard():
     )
 
     # ── AI summary ─────────────────────────────────────────────────
-    summary_text = generate_summary(all_events)
+    fingerprint = _event_fingerprint(all_events)
+    summary_text = _cached_summary(fingerprint, all_events)
 
     # ── Unified map + feed component ──────────────────────────────
-    # We pass the default desktop height explicitly so Streamlit doesn't render voids.
-    # For mobile screens, an overriding CSS selector inside ui/styles.py expands it.
-    dashboard_html = build_dashboard_html(
-        all_events=all_events,
-        geo_events=map_events,
-        component_height=720,
-        summary_text=summary_text,
+    # Re-emitting the exact previous payload keeps the iframe (and the
+    # user's map pan/zoom) mounted when nothing changed since the last tick.
+    render_sig = (
+        store.count(),
+        all_events[0].id if all_events else "",
+        summary_text,
+        int(time.time() // _MAX_STALE_RENDER_SECONDS),
     )
+    if new_count == 0 and st.session_state.get("_last_render_sig") == render_sig:
+        dashboard_html = st.session_state._last_dashboard_html
+    else:
+        dashboard_html = _cached_dashboard_html(
+            fingerprint,
+            summary_text,
+            all_events,
+            map_events,
+        )
+        st.session_state._last_render_sig = render_sig
+        st.session_state._last_dashboard_html = dashboard_html
     # Streamlit wrapper iframe 
     components.html(dashboard_html, height=730, scrolling=False)
 
@@ -267,7 +361,7 @@ def live_dashboard():
         'Analytics &amp; Insights</span></div>',
         unsafe_allow_html=True,
     )
-    comps = get_analytics_components(all_events)
+    comps = _cached_analytics(fingerprint, all_events)
     
     # 1. CSS & Metrics
     st.markdown(comps["css"], unsafe_allow_html=True)
@@ -303,10 +397,7 @@ live_dashboard()
 # ──────────────────────────────────────────────────────────────────────────
 
 st.markdown("---")
-source_links = " · ".join(
-    f"[{s.short_name}]({s.website_url})" for s in SOURCES if s.enabled
-)
-st.caption(f"Data sources: {source_links}")
+st.caption(f"Data sources: {_FOOTER_SOURCE_LINKS}")
 st.caption(
     "Data refreshes automatically every ~60 seconds. "
     "This is an aggregation tool – all content belongs to the original publishers."
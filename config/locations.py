@@ -7,7 +7,11 @@ Used by the geocoder to resolve place-names found in news text.
 To add a new location, simply append it to LOCATIONS dict below.
 """
 
-from typing import Dict, Tuple
+import re
+import sys
+from bisect import bisect_right
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
 
 # (latitude, longitude)
 Coord = Tuple[float, float]
@@ -166,6 +170,105 @@ LOCATIONS: Dict[str, Coord] = {
 }
 
 
+# Freeze with pre-normalised (lowercase, interned) keys so hot-path callers
+# that already hold lowercase names can skip normalisation entirely
+LOCATIONS: Mapping[str, Coord] = MappingProxyType(
+    {sys.intern(name.lower().strip()): coord for name, coord in LOCATIONS.items()}
+)
+
+
+def _trie_regex(names: List[str]) -> str:
+    """Build a regex body matching any of *names*, factored as a prefix trie.
+
+    A flat alternation makes the engine retry every name at every position;
+    sharing prefixes means each input character is examined once per trie
+    level.  Continuations are greedy-optional, so the longest name wins and
+    the engine backtracks to a shorter one if the trailing \\b fails –
+    the same result as a longest-first alternation.
+    """
+    trie: Dict[str, dict] = {}
+    for name in names:
+        node = trie
+        for ch in name:
+            node = node.setdefault(ch, {})
+        node[""] = {}   # end-of-name marker
+
+    def render(node: Dict[str, dict]) -> str:
+        terminal = "" in node
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        if terminal:
+            return "(?:" + body + ")?"
+        return body
+
+    return render(trie)
+
+
+# One pre-compiled pattern over every name, built once at import.
+# Longest match wins, so "Bandar Abbas" matches before "Abbas".  Matched
+# against lowercased text: re.IGNORECASE case-folds every comparison and
+# costs far more than one str.lower() per text.
+_NAME_PATTERN = re.compile(r"\b(" + _trie_regex(list(LOCATIONS)) + r")\b")
+
+
+def find_locations(text: str) -> List[Tuple[str, Coord]]:
+    """Return (name, coord) for every known location in *text*, in order.
+
+    Scans the text once instead of probing each name separately.
+    """
+    found: List[Tuple[str, Coord]] = []
+    for name in _NAME_PATTERN.findall(text.lower()):
+        coord = get_location_norm(name)
+        if coord:
+            found.append((name, coord))
+    return found
+
+
+def find_first_locations(texts: Sequence[str]) -> List[Optional[Tuple[str, Coord]]]:
+    """Return the first (name, coord) in each of *texts*, or None per text.
+
+    All texts are joined and scanned by one regex walk; after a hit the
+    search jumps straight to the next text, so the rest of it is skipped.
+    """
+    found: List[Optional[Tuple[str, Coord]]] = [None] * len(texts)
+    if not texts:
+        return found
+
+    # Newline separators are non-word characters, so \b still holds at the
+    # seams and no name can match across two texts.
+    lowered = [text.lower() for text in texts]
+    starts: List[int] = []
+    offset = 0
+    for text in lowered:
+        starts.append(offset)
+        offset += len(text) + 1
+    joined = "\n".join(lowered)
+
+    pos = 0
+    while True:
+        match = _NAME_PATTERN.search(joined, pos)
+        if match is None:
+            break
+        i = bisect_right(starts, match.start()) - 1
+        name = match.group(1)
+        coord = get_location_norm(name)
+        if coord:
+            found[i] = (name, coord)
+            if i + 1 == len(starts):
+                break
+            pos = starts[i + 1]
+        else:
+            pos = match.end()
+    return found
+
+
+def get_location_norm(name: str) -> Coord | None:
+    """Look up coordinates by an already lowercased, stripped name."""
+    return LOCATIONS.get(name)
+
+
 def get_location(name: str) -> Coord | None:
     """Look up coordinates by location name (case-insensitive)."""
     return LOCATIONS.get(name.lower().strip())
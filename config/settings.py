@@ -3,6 +3,7 @@ Application settings and constants.
 Central configuration for all modules – source URLs, refresh intervals, map defaults.
 """
 
+import os
 from dataclasses import dataclass
 from typing import Dict, List
 
@@ -93,15 +94,40 @@ SOURCES: List[SourceConfig] = [
 ]
 
 SOURCES_BY_NAME: Dict[str, SourceConfig] = {s.name: s for s in SOURCES}
+ENABLED_SOURCES: List[SourceConfig] = [s for s in SOURCES if s.enabled]
 
 # ---------------------------------------------------------------------------
 # Timing
 # ---------------------------------------------------------------------------
 
 REFRESH_INTERVAL_SECONDS: int = 60          # auto-refresh every N seconds
-REQUEST_TIMEOUT_SECONDS: int = 15           # HTTP request timeout
+REQUEST_TIMEOUT_SECONDS: int = 15           # HTTP read timeout
+CONNECT_TIMEOUT_SECONDS: int = 5            # HTTP connect timeout
 MAX_RETRIES: int = 2                        # per-source retry count
 
+
+def _env_workers(name: str, default: int) -> int:
+    """Positive int from environment variable *name*; *default* if unset or invalid."""
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+# A refresh submits one task per enabled source. Timed-out scrapers keep
+# their thread until they finish, so leave room for a few overlapping
+# refreshes, capped so a large registry can't spawn an unbounded pool
+SCRAPER_MAX_WORKERS: int = _env_workers(
+    "SCRAPER_MAX_WORKERS", max(1, min(32, 4 * len(ENABLED_SOURCES)))
+)
+
+# ---------------------------------------------------------------------------
+# Event retention
+# ---------------------------------------------------------------------------
+
+MAX_STORED_EVENTS: int = 500                # oldest events trimmed beyond this
+SEEN_IDS_PER_EVENT: int = 4                 # dedup memory = N × MAX_STORED_EVENTS ids
+
 # ---------------------------------------------------------------------------
 # Map defaults
 # ---------------------------------------------------------------------------
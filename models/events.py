@@ -1,17 +1,22 @@
 """
 Data models for the Iran War Monitoring application.
 
-Uses Pydantic v2 for validation and serialization.
+Events are plain slotted dataclasses: scrapers build a few hundred per
+refresh and the store keeps them all, so construction cost and per-instance
+memory matter more than schema validation.
 """
 
 from __future__ import annotations
 
 import hashlib
+import sys
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from enum import Enum
-from typing import List, Optional
+from typing import List, Optional, Tuple
 
-from pydantic import BaseModel, Field, field_validator
+from config.settings import MAX_STORED_EVENTS, SEEN_IDS_PER_EVENT
 
 
 # ---------------------------------------------------------------------------
@@ -47,41 +52,55 @@ EVENT_TYPE_CONFIG = {
 # NewsEvent
 # ---------------------------------------------------------------------------
 
-class NewsEvent(BaseModel):
+@dataclass(slots=True)
+class NewsEvent:
     """A single geolocated news event from any source."""
 
-    id: str = Field(default="", description="Unique hash (auto-generated if empty)")
     title: str
-    summary: str = ""
     source_name: str
+    id: str = ""                 # unique hash, auto-generated if empty
+    summary: str = ""
     source_url: str = ""
-    timestamp: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    timestamp: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
     location_name: str = ""
     latitude: Optional[float] = None
     longitude: Optional[float] = None
     event_type: EventType = EventType.OTHER
-    severity: int = Field(default=3, ge=1, le=5)
+    severity: int = 3            # 1 (low) … 5 (critical)
 
     # For internal processing – not displayed
-    raw_text: str = Field(default="", repr=False)
+    raw_text: str = field(default="", repr=False)
+
+    # Epoch seconds of ``timestamp``, cached for cheap float comparisons.
+    # Derived in __post_init__; read-only for everything else.
+    epoch: float = field(default=0.0, init=False, repr=False, compare=False)
+    # Lowercased, stripped title, cached for the deduplicator and the id hash
+    title_norm: str = field(default="", init=False, repr=False, compare=False)
 
-    def model_post_init(self, __context) -> None:
-        """Auto-generate a deterministic id from title + source (no timestamp).
+    def __post_init__(self) -> None:
+        """Normalise fields and auto-generate a deterministic id.
 
-        Dropping the timestamp guarantees the exact same headline from the
-        same source always maps to the same ID, regardless of scrape time.
+        The id is derived from title + source (no timestamp), which
+        guarantees the exact same headline from the same source always
+        maps to the same ID, regardless of scrape time.
         """
+        if self.timestamp.tzinfo is None:
+            # .timestamp() would silently read a naive value as local time
+            raise ValueError(f"NewsEvent timestamp must be timezone-aware: {self.timestamp!r}")
+        if self.latitude is not None:
+            self.latitude = max(-90.0, min(90.0, float(self.latitude)))
+        if self.longitude is not None:
+            self.longitude = max(-180.0, min(180.0, float(self.longitude)))
+        self.event_type = EventType(self.event_type)
+        self.severity = max(1, min(5, int(self.severity)))
+        self.epoch = self.timestamp.timestamp()
+        self.title_norm = self.title.lower().strip()
         if not self.id:
-            norm_title = self.title.lower().strip()
-            blob = f"{norm_title}|{self.source_name}"
-            self.id = hashlib.sha256(blob.encode()).hexdigest()[:16]
-
-    @field_validator("severity", mode="before")
-    @classmethod
-    def clamp_severity(cls, v):
-        if isinstance(v, (int, float)):
-            return max(1, min(5, int(v)))
-        return v
+            blob = f"{self.title_norm}|{self.source_name}"
+            # Interned so set/dict probes in the store compare by identity
+            # 64-bit BLAKE2b: non-cryptographic use, same 16-hex-char format
+            # as before and faster than truncating a SHA-256 digest
+            self.id = sys.intern(hashlib.blake2b(blob.encode(), digest_size=8).hexdigest())
 
     @property
     def has_location(self) -> bool:
@@ -90,12 +109,13 @@ class NewsEvent(BaseModel):
     @property
     def display_config(self) -> dict:
         """Return icon/colour/emoji for this event type."""
-        return EVENT_TYPE_CONFIG.get(self.event_type, EVENT_TYPE_CONFIG[EventType.OTHER])
+        # event_type is coerced to EventType on construction, so always a key
+        return EVENT_TYPE_CONFIG[self.event_type]
 
     def age_minutes(self, now: datetime | None = None) -> float:
         """Minutes elapsed since the event timestamp."""
         now = now or datetime.now(timezone.utc)
-        return (now - self.timestamp).total_seconds() / 60.0
+        return (now.timestamp() - self.epoch) / 60.0
 
 
 # ---------------------------------------------------------------------------
@@ -105,16 +125,37 @@ class NewsEvent(BaseModel):
 class EventStore:
     """Thread-safe in-memory store for NewsEvent instances."""
 
-    def __init__(self, max_events: int = 500) -> None:
+    def __init__(self, max_events: int = MAX_STORED_EVENTS) -> None:
         self._events: dict[str, NewsEvent] = {}   # id → event
+        # Recently accepted ids (insertion-ordered, bounded) – also covers
+        # events since trimmed, so a feed that keeps listing an old item
+        # can't re-insert it
+        self._seen: dict[str, None] = {}
+        self._max_seen = max_events * SEEN_IDS_PER_EVENT
+        # Parallel arrays kept in ascending timestamp order: epoch seconds
+        # for O(log N) "how many since" queries, events for sort-free reads
+        self._ts_sorted: list[float] = []
+        self._by_time: list[NewsEvent] = []
+        self._geo_ts_sorted: list[float] = []
+        self._geo_by_time: list[NewsEvent] = []
+        # Cached newest-first read-only views, rebuilt lazily after writes
+        self._snapshot: Optional[Tuple[NewsEvent, ...]] = None
+        self._geo_snapshot: Optional[Tuple[NewsEvent, ...]] = None
         self._max_events = max_events
 
     def add(self, event: NewsEvent) -> bool:
         """Add event if not already present. Returns True if newly added."""
-        if event.id in self._events:
+        if event.id in self._seen or event.id in self._events:
             return False
+        self._seen[event.id] = None
+        if len(self._seen) > self._max_seen:
+            del self._seen[next(iter(self._seen))]
         self._events[event.id] = event
+        _insert_sorted(self._ts_sorted, self._by_time, event)
+        if event.has_location:
+            _insert_sorted(self._geo_ts_sorted, self._geo_by_time, event)
         self._trim()
+        self._snapshot = self._geo_snapshot = None
         return True
 
     def add_many(self, events: List[NewsEvent]) -> int:
@@ -125,25 +166,76 @@ class EventStore:
                 added += 1
         return added
 
-    def get_all(self, *, with_location_only: bool = False) -> List[NewsEvent]:
-        """Return events sorted newest-first."""
-        events = list(self._events.values())
+    def seen(self, event_id: str) -> bool:
+        """Return True if an event with *event_id* was added recently."""
+        return event_id in self._seen
+
+    def get_all(self, *, with_location_only: bool = False) -> Tuple[NewsEvent, ...]:
+        """Return events sorted newest-first.
+
+        The result is a shared, read-only snapshot that is only rebuilt
+        after the store changes, so repeated calls per tick are free.
+        """
         if with_location_only:
-            events = [e for e in events if e.has_location]
-        events.sort(key=lambda e: e.timestamp, reverse=True)
-        return events
+            if self._geo_snapshot is None:
+                self._geo_snapshot = tuple(reversed(self._geo_by_time))
+            return self._geo_snapshot
+        if self._snapshot is None:
+            self._snapshot = tuple(reversed(self._by_time))
+        return self._snapshot
 
     def count(self) -> int:
         return len(self._events)
 
+    def count_since(self, cutoff: float, *, with_location_only: bool = False) -> int:
+        """Count events whose timestamp is at or after *cutoff* (epoch seconds)."""
+        ts_sorted = self._geo_ts_sorted if with_location_only else self._ts_sorted
+        return len(ts_sorted) - bisect_left(ts_sorted, cutoff)
+
     def clear(self) -> None:
         self._events.clear()
+        self._seen.clear()
+        self._ts_sorted.clear()
+        self._by_time.clear()
+        self._geo_ts_sorted.clear()
+        self._geo_by_time.clear()
+        self._snapshot = self._geo_snapshot = None
 
     def _trim(self) -> None:
-        """Remove oldest events if store exceeds max."""
-        if len(self._events) > self._max_events:
-            sorted_ids = sorted(
-                self._events, key=lambda k: self._events[k].timestamp
-            )
-            for eid in sorted_ids[: len(self._events) - self._max_events]:
-                del self._events[eid]
+        """Remove oldest events if store exceeds max.
+
+        The oldest events sit at the front of the time-ordered arrays, so
+        no re-sort is needed.  Among equal timestamps the earliest-added
+        event goes first; that is the last entry of the tie group because
+        ties are inserted in front of existing ones.
+        """
+        while len(self._events) > self._max_events:
+            i = bisect_right(self._ts_sorted, self._ts_sorted[0]) - 1
+            event = self._by_time[i]
+            del self._ts_sorted[i]
+            del self._by_time[i]
+            del self._events[event.id]
+            if event.has_location:
+                _remove_sorted(self._geo_ts_sorted, self._geo_by_time, event)
+
+
+def _insert_sorted(ts_sorted: list[float], by_time: list[NewsEvent], event: NewsEvent) -> None:
+    """Insert *event* into the parallel ascending arrays.
+
+    Ties go before existing entries so that reading the arrays backwards
+    lists equal timestamps in insertion order, as the old stable sort did.
+    """
+    i = bisect_left(ts_sorted, event.epoch)
+    ts_sorted.insert(i, event.epoch)
+    by_time.insert(i, event)
+
+
+def _remove_sorted(ts_sorted: list[float], by_time: list[NewsEvent], event: NewsEvent) -> None:
+    """Remove *event* from the parallel ascending arrays."""
+    i = bisect_left(ts_sorted, event.epoch)
+    while i < len(ts_sorted) and ts_sorted[i] == event.epoch:
+        if by_time[i] is event:
+            del ts_sorted[i]
+            del by_time[i]
+            return
+        i += 1
@@ -11,62 +11,85 @@ from typing import List, Tuple
 
 from models.events import EventType
 
-# Ordered by priority – first match wins
+# Ordered by priority – first match wins.
+# Patterns are written in lowercase and matched against lowercased text:
+# re.IGNORECASE makes every character comparison case-fold and was the
+# bulk of the categorizer's cost.
 _RULES: List[Tuple[EventType, re.Pattern]] = [
     (EventType.AIRSTRIKE, re.compile(
         r"airstrike|air\s*strike|bomb(?:ing|ed|s)|strikes?\s+on|struck|"
-        r"sortie|fighter\s*jet|warplane|b-2|stealth|bunker\s*buster",
-        re.IGNORECASE,
+        r"sortie|fighter\s*jet|warplane|b-2|stealth|bunker\s*buster"
     )),
     (EventType.MISSILE, re.compile(
         r"missile|ballistic|cruise\s*missile|intercept|iron\s*dome|"
         r"patriot|arrow\s*system|thaad|s-?300|launch(?:ed|es)?.*(?:missile|rocket)|"
-        r"rocket|drone\s*strike|drone\s*attack|UAV",
-        re.IGNORECASE,
+        r"rocket|drone\s*strike|drone\s*attack|uav"
     )),
     (EventType.EXPLOSION, re.compile(
         r"explosion|blast|detonat|explod|boom|fire\b|burning|"
-        r"smoke\s*(?:rising|seen|billowing)|damage",
-        re.IGNORECASE,
+        r"smoke\s*(?:rising|seen|billowing)|damage"
     )),
     (EventType.ALERT, re.compile(
         r"siren|alert|warning|shelter|evacuat|airspace\s*clos|"
-        r"take\s*cover|emergency|no-fly\s*zone",
-        re.IGNORECASE,
+        r"take\s*cover|emergency|no-fly\s*zone"
     )),
     (EventType.MILITARY_MOVEMENT, re.compile(
         r"military\s*movement|troop|deploy|naval|carrier|fleet|"
         r"aircraft\s*carrier|destroyer|submarine|convoy|mobiliz|"
         r"operation\b|combat\s*operation|regiment|battalion|"
-        r"pentagon|defense\s*minister|IDF|IRGC|5th\s*fleet",
-        re.IGNORECASE,
+        r"pentagon|defense\s*minister|idf|irgc|5th\s*fleet"
     )),
     (EventType.HUMANITARIAN, re.compile(
         r"casualt|killed|dead|wounded|injur|hospital|refugee|"
         r"humanitarian|civilian|school|children|rescue|aid\b|red\s*cross|"
-        r"red\s*crescent|relief",
-        re.IGNORECASE,
+        r"red\s*crescent|relief"
     )),
     (EventType.POLITICAL, re.compile(
-        r"sanction|diplomat|UN\b|united\s*nations|security\s*council|"
+        r"sanction|diplomat|un\b|united\s*nations|security\s*council|"
         r"president\b|prime\s*minister|foreign\s*minister|condemn|"
         r"statement|ceasefire|negotiat|peace\s*talk|resolution|"
-        r"urge.*restraint|calls\s+on|appeals?\s+to",
-        re.IGNORECASE,
+        r"urge.*restraint|calls\s+on|appeals?\s+to"
     )),
 ]
 
 
+# All rules folded into one pattern so the text is scanned once.  Each
+# alternative sits inside a zero-width lookahead, so the leftmost hit
+# reports the highest-priority rule matching at that position.
+_COMBINED = re.compile(
+    "(?=" + "|".join(f"(?P<{et.name}>{p.pattern})" for et, p in _RULES) + ")"
+)
+_PRIORITY = {et.name: i for i, (et, _) in enumerate(_RULES)}
+
+
 def categorize_event(title: str, summary: str = "") -> EventType:
     """
     Classify an event by scanning title (priority) then summary.
     Returns the first matching EventType, or OTHER.
     """
-    combined = f"{title} {summary}"
-    for event_type, pattern in _RULES:
-        if pattern.search(combined):
+    return categorize_text(f"{title} {summary}".lower())
+
+
+def categorize_text(text: str) -> EventType:
+    """Classify already combined, lowercased ``title + " " + summary`` text."""
+    first = _COMBINED.search(text)
+    if first is None:
+        return EventType.OTHER
+    rank = _PRIORITY[first.lastgroup]
+    # Higher-priority rules cannot match at or before the first hit, so
+    # only the rest of the text needs checking for them
+    for event_type, pattern in _RULES[:rank]:
+        if pattern.search(text, first.start() + 1):
             return event_type
-    return EventType.OTHER
+    return _RULES[rank][0]
+
+
+# Severity cues, compiled once (matched against lowercased text)
+_SEV_FATAL = re.compile(r"killed|dead|casualt|mass|catastroph")
+# Confirmed strikes and launches/alerts both score 4, so one scan covers both
+_SEV_STRIKE = re.compile(r"airstrike|struck|missile\s*hit|explosion|launch|intercept|siren|alert")
+_SEV_DEESCALATE = re.compile(r"condemn|urge|statement|negotiat|diplomat")
+_SEV_DISRUPTION = re.compile(r"suspend.*flight|close.*airspace")
 
 
 def estimate_severity(title: str, summary: str = "") -> int:
@@ -74,22 +97,23 @@ def estimate_severity(title: str, summary: str = "") -> int:
     Heuristic severity score 1-5.
     Higher for confirmed strikes, casualties; lower for political statements.
     """
-    combined = f"{title} {summary}".lower()
+    return estimate_severity_text(f"{title} {summary}".lower())
 
+
+def estimate_severity_text(text: str) -> int:
+    """Score already combined, lowercased ``title + " " + summary`` text."""
     score = 3  # default
 
     # Escalate
-    if re.search(r"killed|dead|casualt|mass|catastroph", combined):
+    if _SEV_FATAL.search(text):
         score = 5
-    elif re.search(r"airstrike|struck|missile\s*hit|explosion", combined):
-        score = 4
-    elif re.search(r"launch|intercept|siren|alert", combined):
+    elif _SEV_STRIKE.search(text):
         score = 4
 
     # De-escalate
-    if re.search(r"condemn|urge|statement|negotiat|diplomat", combined):
+    if _SEV_DEESCALATE.search(text):
         score = min(score, 2)
-    if re.search(r"suspend.*flight|close.*airspace", combined):
+    if _SEV_DISRUPTION.search(text):
         score = min(score, 3)
 
     return max(1, min(5, score))
@@ -10,44 +10,70 @@ Same-source duplicates use a wider window (120 min) and higher similarity
 
 from __future__ import annotations
 
-from datetime import timedelta
+from collections import deque
 from difflib import SequenceMatcher
-from typing import List
+from typing import Deque, List
 
 from models.events import NewsEvent
 
 # ── Thresholds ────────────────────────────────────────────────────────────
 # Cross-source: different outlets covering the same story
 _CROSS_SOURCE_WINDOW_MIN = 30
+_CROSS_SOURCE_WINDOW_SECONDS = _CROSS_SOURCE_WINDOW_MIN * 60
 _CROSS_SOURCE_SIM = 0.65
 
 # Same-source: the same outlet re-publishing / updating a headline
 _SAME_SOURCE_WINDOW_MIN = 120
+_SAME_SOURCE_WINDOW_SECONDS = _SAME_SOURCE_WINDOW_MIN * 60
 _SAME_SOURCE_SIM = 0.85
 
+# Widest window either rule can match in; pairs further apart are skipped
+_MAX_WINDOW_SECONDS = max(_CROSS_SOURCE_WINDOW_SECONDS, _SAME_SOURCE_WINDOW_SECONDS)
 
-def _similar(a: str, b: str, threshold: float) -> bool:
-    """Return True if normalised similarity ≥ threshold."""
-    a_norm = a.lower().strip()
-    b_norm = b.lower().strip()
-    if a_norm == b_norm:
-        return True
-    return SequenceMatcher(None, a_norm, b_norm).ratio() >= threshold
+
+def _matcher_for(event: NewsEvent) -> SequenceMatcher:
+    """Return a SequenceMatcher with *event*'s title set as the second sequence.
+
+    difflib indexes the second sequence once and caches it, so one matcher
+    per stored event lets every incoming title be compared against it
+    without rebuilding that index for each pair.
+    """
+    matcher = SequenceMatcher(None)
+    matcher.set_seq2(event.title_norm)
+    return matcher
 
 
-def _is_duplicate(event: NewsEvent, existing: NewsEvent) -> bool:
-    """Check whether *event* is a duplicate of *existing*."""
+def _similar(a_norm: str, matcher: SequenceMatcher, threshold: float) -> bool:
+    """Return True if similarity of normalised *a_norm* to the matcher's title ≥ threshold."""
+    if a_norm == matcher.b:
+        return True
+    matcher.set_seq1(a_norm)
+    # real_quick_ratio() and quick_ratio() are cheap upper bounds on ratio(),
+    # so most unrelated pairs are rejected before the full matching pass
+    return (
+        matcher.real_quick_ratio() >= threshold
+        and matcher.quick_ratio() >= threshold
+        and matcher.ratio() >= threshold
+    )
+
+
+def _is_duplicate(
+    event: NewsEvent,
+    existing: NewsEvent,
+    matcher: SequenceMatcher,
+) -> bool:
+    """Check whether *event* is a duplicate of *existing* (whose matcher is given)."""
     same_source = event.source_name == existing.source_name
 
     if same_source:
-        window = timedelta(minutes=_SAME_SOURCE_WINDOW_MIN)
+        window_seconds = _SAME_SOURCE_WINDOW_SECONDS
         threshold = _SAME_SOURCE_SIM
     else:
-        window = timedelta(minutes=_CROSS_SOURCE_WINDOW_MIN)
+        window_seconds = _CROSS_SOURCE_WINDOW_SECONDS
         threshold = _CROSS_SOURCE_SIM
 
-    time_close = abs(event.timestamp - existing.timestamp) <= window
-    return time_close and _similar(event.title, existing.title, threshold)
+    time_close = abs(event.epoch - existing.epoch) <= window_seconds
+    return time_close and _similar(event.title_norm, matcher, threshold)
 
 
 def deduplicate(events: List[NewsEvent]) -> List[NewsEvent]:
@@ -61,37 +87,29 @@ def deduplicate(events: List[NewsEvent]) -> List[NewsEvent]:
         return []
 
     kept: List[NewsEvent] = []
+    matchers: List[SequenceMatcher] = []   # parallel to kept
+    # Indices into kept that are still within the widest time window of
+    # the current event.  Events are visited oldest-first, so anything that
+    # falls out of the window can never match a later event either.
+    window: Deque[int] = deque()
+
+    for event in sorted(events, key=lambda e: e.epoch):
+        cutoff = event.epoch - _MAX_WINDOW_SECONDS
+        while window and kept[window[0]].epoch < cutoff:
+            window.popleft()
 
-    for event in events:
         is_dup = False
-        for i, existing in enumerate(kept):
-            if _is_duplicate(event, existing):
+        for i in window:
+            existing = kept[i]
+            if _is_duplicate(event, existing, matchers[i]):
                 if len(event.summary) > len(existing.summary):
                     kept[i] = event
+                    matchers[i] = _matcher_for(event)
                 is_dup = True
                 break
         if not is_dup:
+            window.append(len(kept))
             kept.append(event)
+            matchers.append(_matcher_for(event))
 
     return kept
-
-
-def deduplicate_against_existing(
-    incoming: List[NewsEvent],
-    existing: List[NewsEvent],
-) -> List[NewsEvent]:
-    """Return only those *incoming* events that are NOT duplicates of *existing*.
-
-    This is used to filter a freshly-scraped batch against the store before
-    adding, catching duplicates that survived the batch-only dedup.
-    """
-    novel: List[NewsEvent] = []
-    for event in incoming:
-        is_dup = False
-        for ex in existing:
-            if _is_duplicate(event, ex):
-                is_dup = True
-                break
-        if not is_dup:
-            novel.append(event)
-    return novel
@@ -7,17 +7,9 @@ place-name mentions in free text and return their coordinates.
 
 from __future__ import annotations
 
-import re
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
-from config.locations import LOCATIONS, Coord
-
-# Pre-compile patterns: sort by length desc so "Bandar Abbas" matches before "Abbas"
-_SORTED_NAMES = sorted(LOCATIONS.keys(), key=len, reverse=True)
-_PATTERN = re.compile(
-    r"\b(" + "|".join(re.escape(n) for n in _SORTED_NAMES) + r")\b",
-    re.IGNORECASE,
-)
+from config.locations import find_first_locations, find_locations
 
 
 def extract_locations(text: str) -> List[Tuple[str, float, float]]:
@@ -29,20 +21,26 @@ def extract_locations(text: str) -> List[Tuple[str, float, float]]:
     seen: set[str] = set()
     results: List[Tuple[str, float, float]] = []
 
-    for match in _PATTERN.finditer(text):
-        key = match.group(0).lower().strip()
+    for key, (lat, lon) in find_locations(text):
         if key in seen:
             continue
         seen.add(key)
-        coord: Optional[Coord] = LOCATIONS.get(key)
-        if coord:
-            lat, lon = coord
-            results.append((key.title(), lat, lon))
+        results.append((key.title(), lat, lon))
 
     return results
 
 
+def extract_primary_locations(
+    texts: Sequence[str],
+) -> List[Optional[Tuple[str, float, float]]]:
+    """Return the first location of each text (or None), scanning all at once."""
+    return [
+        (hit[0].title(), hit[1][0], hit[1][1]) if hit else None
+        for hit in find_first_locations(texts)
+    ]
+
+
 def extract_primary_location(text: str) -> Optional[Tuple[str, float, float]]:
     """Return the first (most prominent) location in text, or None."""
-    locations = extract_locations(text)
-    return locations[0] if locations else None
+    return extract_primary_locations([text])[0]
+
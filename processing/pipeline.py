@@ -0,0 +1,38 @@
+"""
+Batch enrichment of freshly scraped events.
+
+Classification, severity scoring and geolocation all read the same
+``title + summary`` text.  Building and lowercasing it once per event and
+sharing it between the three stages avoids re-allocating it per stage,
+and lets the geocoder scan the whole batch in one pass.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+from models.events import EventType, NewsEvent
+from processing.categorizer import categorize_text, estimate_severity_text
+from processing.geocoder import extract_primary_locations
+
+
+def enrich_events(events: Sequence[NewsEvent]) -> None:
+    """Fill in event_type, severity and location, in place, where missing."""
+    texts = [f"{ev.title} {ev.summary}".lower() for ev in events]
+
+    pending_ev: list[NewsEvent] = []
+    pending_text: list[str] = []
+    for ev, text in zip(events, texts):
+        if ev.event_type is EventType.OTHER:
+            ev.event_type = categorize_text(text)
+        if ev.severity == 3:
+            ev.severity = estimate_severity_text(text)
+        if not ev.has_location:
+            pending_ev.append(ev)
+            pending_text.append(text)
+
+    for ev, loc in zip(pending_ev, extract_primary_locations(pending_text)):
+        if loc:
+            ev.location_name = loc[0]
+            ev.latitude = loc[1]
+            ev.longitude = loc[2]
@@ -13,7 +13,7 @@ The summary analyses the last 2 hours of events, extracting:
 from __future__ import annotations
 
 from collections import Counter
-from datetime import datetime, timezone, timedelta
+from datetime import datetime, timezone
 from typing import List
 
 from models.events import EventType, EVENT_TYPE_CONFIG, NewsEvent
@@ -60,35 +60,35 @@ def generate_summary(events: List[NewsEvent]) -> str:
     str
         Natural-language summary. Empty string if no recent events.
     """
-    now = datetime.now(timezone.utc)
-    cutoff = now - timedelta(hours=_SUMMARY_WINDOW_HOURS)
+    now = datetime.now(timezone.utc).timestamp()
+    cutoff = now - _SUMMARY_WINDOW_HOURS * 3600
+    trend_cutoff_recent = now - _TREND_RECENT_MIN * 60
+    trend_cutoff_older = now - (_TREND_RECENT_MIN + _TREND_OLDER_MIN) * 60
 
-    recent = [ev for ev in events if ev.timestamp >= cutoff]
-    if not recent:
-        return "No significant events reported in the last 2 hours."
-
-    # ── Counts by type ────────────────────────────────────────────
-    type_counts: Counter = Counter()
-    for ev in recent:
-        label = ev.display_config["label"]
-        type_counts[label] += 1
-
-    # ── Top locations ─────────────────────────────────────────────
+    # ── Single pass: counts by type and location, intensity trend ──
+    etype_counts: Counter = Counter()
     loc_counts: Counter = Counter()
-    for ev in recent:
+    count_recent = count_older = 0
+    for ev in events:
+        ts = ev.epoch
+        if ts < cutoff:
+            continue
+        etype_counts[ev.event_type] += 1
         if ev.location_name:
             loc_counts[ev.location_name] += 1
-    top_locations = [loc for loc, _ in loc_counts.most_common(3)]
+        if ts >= trend_cutoff_recent:
+            count_recent += 1
+        elif ts >= trend_cutoff_older:
+            count_older += 1
 
-    # ── Intensity trend ───────────────────────────────────────────
-    trend_cutoff_recent = now - timedelta(minutes=_TREND_RECENT_MIN)
-    trend_cutoff_older = now - timedelta(minutes=_TREND_RECENT_MIN + _TREND_OLDER_MIN)
+    if not etype_counts:
+        return "No significant events reported in the last 2 hours."
 
-    count_recent = sum(1 for ev in recent if ev.timestamp >= trend_cutoff_recent)
-    count_older = sum(
-        1 for ev in recent
-        if trend_cutoff_older <= ev.timestamp < trend_cutoff_recent
-    )
+    # Resolve each label once per type, not per event
+    type_counts: Counter = Counter()
+    for etype, count in etype_counts.items():
+        type_counts[EVENT_TYPE_CONFIG[etype]["label"]] += count
+    top_locations = [loc for loc, _ in loc_counts.most_common(3)]
 
     # ── Build sentences ───────────────────────────────────────────
     sentences: list[str] = []
@@ -1,34 +1,213 @@
 """
 Abstract base class for all news scrapers.
 
-Provides HTTP fetching with retry, User-Agent rotation,
-timeout, response caching, and graceful error handling.
+Provides HTTP fetching over a shared keep-alive session with retry,
+User-Agent rotation, timeout, response caching, conditional GETs
+(ETag / Last-Modified), and graceful error handling.
 """
 
 from __future__ import annotations
 
+import hashlib
 import random
 import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Callable, List, Optional
 
+import lxml.html
 import requests
+from lxml import etree
+from requests.adapters import HTTPAdapter
 
 from config.settings import (
+    CONNECT_TIMEOUT_SECONDS,
     MAX_RETRIES,
     REQUEST_TIMEOUT_SECONDS,
     USER_AGENTS,
 )
 from models.events import NewsEvent
-from processing.categorizer import categorize_event, estimate_severity
-from processing.geocoder import extract_primary_location
+from processing.pipeline import enrich_events
 from utils.cache import TTLCache
 from utils.logger import get_logger
 
-_response_cache = TTLCache(ttl=55)
+_response_cache = TTLCache(ttl=55, maxsize=64)
+
+# One keep-alive session for every scraper: repeat polls of a host reuse
+# the pooled TCP/TLS connection instead of handshaking on each fetch.
+# Retries stay in fetch_url so they keep their logging and backoff.
+_session = requests.Session()
+_adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+_session.mount("https://", _adapter)
+_session.mount("http://", _adapter)
+
+# Static request headers; only the User-Agent rotates per fetch
+_BASE_HEADERS = {
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Validators of the last full response per URL, for conditional GETs:
+# url → (ETag, Last-Modified, body).  One entry per configured source.
+_validators: dict[str, tuple[str, str, str]] = {}
+# Digest of the last parsed body and its events, per source name
+_parsed_bodies: dict[str, tuple[bytes, List[NewsEvent]]] = {}
 logger = get_logger(__name__)
 
 
+def fetch_url(url: str, source_name: str, max_bytes: Optional[int] = None) -> Optional[str]:
+    """HTTP GET with retry, caching, and User-Agent rotation.
+
+    Shared by HTML and RSS scrapers so every source goes through the same
+    timeout-bounded, cached network path. With *max_bytes*, the body is
+    streamed and only its first *max_bytes* bytes are kept. Returns None
+    on failure.
+    """
+    cached = _response_cache.get(url)
+    if cached is not None:
+        return cached
+
+    headers = {**_BASE_HEADERS, "User-Agent": random.choice(USER_AGENTS)}
+    known = _validators.get(url)
+    if known is not None:
+        etag, last_modified, _ = known
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    last_error: Optional[Exception] = None
+    for attempt in range(1, MAX_RETRIES + 1):
+        try:
+            with _session.get(
+                url,
+                headers=headers,
+                timeout=(CONNECT_TIMEOUT_SECONDS, REQUEST_TIMEOUT_SECONDS),
+                stream=max_bytes is not None,
+            ) as resp:
+                # Unchanged since the last full download: reuse that body
+                if resp.status_code == 304 and known is not None:
+                    _response_cache.set(url, known[2])
+                    return known[2]
+                resp.raise_for_status()
+                # requests falls back to ISO-8859-1 for undeclared text/* bodies;
+                # feeds and pages without a charset are overwhelmingly UTF-8
+                if "charset=" not in resp.headers.get("Content-Type", "").lower():
+                    resp.encoding = "utf-8"
+                text = resp.text if max_bytes is None else _read_capped(resp, max_bytes)
+            _response_cache.set(url, text)
+            etag = resp.headers.get("ETag", "")
+            last_modified = resp.headers.get("Last-Modified", "")
+            if etag or last_modified:
+                _validators[url] = (etag, last_modified, text)
+            return text
+        except requests.HTTPError as exc:
+            last_error = exc
+            status = exc.response.status_code if exc.response is not None else 0
+            logger.warning(
+                "%s – attempt %d/%d failed: %s",
+                source_name, attempt, MAX_RETRIES, exc,
+            )
+            # Don't retry on permanent rejections (401/403)
+            if status in (401, 403):
+                break
+            time.sleep(0.5)
+        except requests.RequestException as exc:
+            last_error = exc
+            logger.warning(
+                "%s – attempt %d/%d failed: %s",
+                source_name, attempt, MAX_RETRIES, exc,
+            )
+            time.sleep(0.5)
+
+    logger.error("%s – all attempts exhausted: %s", source_name, last_error)
+    return None
+
+
+def _read_capped(resp: requests.Response, max_bytes: int) -> str:
+    """Decode at most *max_bytes* of a streamed response body."""
+    chunks: list[bytes] = []
+    size = 0
+    for chunk in resp.iter_content(chunk_size=64 * 1024):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= max_bytes:
+            break
+    # A multi-byte character cut at the cap decodes to U+FFFD, as resp.text would
+    return b"".join(chunks)[:max_bytes].decode(resp.encoding or "utf-8", errors="replace")
+
+
+# ── HTML helpers for the live-blog scrapers ──────────────────────────────
+# lxml with precompiled XPath instead of BeautifulSoup: same libxml2 parse,
+# without building a parallel tree of Python objects on top of it.
+
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
+
+ARTICLES = etree.XPath("//article")
+
+# Text nodes as BeautifulSoup's get_text() sees them (no script/style)
+_VISIBLE_TEXT = etree.XPath(
+    ".//text()[not(ancestor::script or ancestor::style or ancestor::template)]"
+)
+
+
+def parse_html(html: str) -> etree._Element:
+    """Parse an HTML document into an lxml element tree."""
+    # Encoded so an XML/charset declaration in the markup can't conflict
+    return lxml.html.fromstring(html.encode("utf-8"), parser=_HTML_PARSER)
+
+
+def scan_entry(entry: etree._Element) -> tuple[
+    Optional[etree._Element], List[etree._Element], Optional[etree._Element], Optional[etree._Element]
+]:
+    """First h2/h3/h4, first three <p>, first <time> and first <a href> under *entry*.
+
+    One C-filtered walk over the descendants instead of a query per field,
+    stopping as soon as everything has been found.
+    """
+    heading = time_el = link = None
+    paragraphs: List[etree._Element] = []
+    for el in entry.iterdescendants("h2", "h3", "h4", "p", "time", "a"):
+        tag = el.tag
+        if tag == "p":
+            if len(paragraphs) < 3:
+                paragraphs.append(el)
+        elif tag == "time":
+            if time_el is None:
+                time_el = el
+        elif tag == "a":
+            if link is None and el.get("href") is not None:
+                link = el
+        elif heading is None:
+            heading = el
+        if heading is not None and time_el is not None and link is not None and len(paragraphs) == 3:
+            break
+    return heading, paragraphs, time_el, link
+
+
+def element_text(el: etree._Element) -> str:
+    """Stripped text of *el* joined without separators (bs4 ``get_text(strip=True)``)."""
+    return "".join(s.strip() for s in _VISIBLE_TEXT(el))
+
+
+def parse_once(
+    source_name: str,
+    body: str,
+    parse: Callable[[str], List[NewsEvent]],
+) -> List[NewsEvent]:
+    """Return ``parse(body)``, reusing the last result while *body* is unchanged.
+
+    Feeds are often re-served bit-identical (with or without a 304), and
+    parsing plus enrichment costs far more than hashing the body.
+    """
+    digest = hashlib.blake2b(body.encode(), digest_size=16).digest()
+    cached = _parsed_bodies.get(source_name)
+    if cached is not None and cached[0] == digest:
+        return list(cached[1])
+    events = parse(body)
+    _parsed_bodies[source_name] = (digest, events)
+    return list(events)
+
+
 class BaseScraper(ABC):
     """
     Base class that every source scraper inherits from.
@@ -41,6 +220,9 @@ class BaseScraper(ABC):
 
     SOURCE_NAME: str = ""
     SOURCE_URL: str = ""
+    # Download cap for the page; only the first 50 entries are parsed, and
+    # live blogs keep their newest entries at the top. None = no cap.
+    MAX_BYTES: Optional[int] = 2 * 1024 * 1024
 
     # ------------------------------------------------------------------
     # Public API
@@ -55,8 +237,7 @@ class BaseScraper(ABC):
             html = self._fetch()
             if not html:
                 return []
-            events = self.parse(html)
-            return [self._enrich(ev) for ev in events]
+            return parse_once(self.SOURCE_NAME, html, self._parse_and_enrich)
         except Exception as exc:
             logger.error("Scraper %s failed: %s", self.SOURCE_NAME, exc)
             return []
@@ -75,69 +256,19 @@ class BaseScraper(ABC):
     # ------------------------------------------------------------------
 
     def _fetch(self) -> Optional[str]:
-        """HTTP GET with retry, caching, and User-Agent rotation."""
-        cached = _response_cache.get(self.SOURCE_URL)
-        if cached is not None:
-            return cached
-
-        headers = {
-            "User-Agent": random.choice(USER_AGENTS),
-            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
-            "Accept-Language": "en-US,en;q=0.9",
-        }
-
-        last_error: Optional[Exception] = None
-        for attempt in range(1, MAX_RETRIES + 1):
-            try:
-                resp = requests.get(
-                    self.SOURCE_URL,
-                    headers=headers,
-                    timeout=REQUEST_TIMEOUT_SECONDS,
-                )
-                resp.raise_for_status()
-                _response_cache.set(self.SOURCE_URL, resp.text)
-                return resp.text
-            except requests.HTTPError as exc:
-                last_error = exc
-                status = exc.response.status_code if exc.response is not None else 0
-                logger.warning(
-                    "%s – attempt %d/%d failed: %s",
-                    self.SOURCE_NAME, attempt, MAX_RETRIES, exc,
-                )
-                # Don't retry on permanent rejections (401/403)
-                if status in (401, 403):
-                    break
-                time.sleep(0.5)
-            except requests.RequestException as exc:
-                last_error = exc
-                logger.warning(
-                    "%s – attempt %d/%d failed: %s",
-                    self.SOURCE_NAME, attempt, MAX_RETRIES, exc,
-                )
-                time.sleep(0.5)
-
-        logger.error("%s – all attempts exhausted: %s", self.SOURCE_NAME, last_error)
-        return None
-
-    def _enrich(self, event: NewsEvent) -> NewsEvent:
-        """Fill in event_type, severity, and geolocation if missing."""
-        # Auto-classify
-        if event.event_type.value == "other":
-            event.event_type = categorize_event(event.title, event.summary)
-        if event.severity == 3:
-            event.severity = estimate_severity(event.title, event.summary)
-
-        # Auto-geolocate
-        if not event.has_location:
-            text = f"{event.title} {event.summary}"
-            loc = extract_primary_location(text)
-            if loc:
-                event.location_name = loc[0]
-                event.latitude = loc[1]
-                event.longitude = loc[2]
-
-        # Ensure source is set
-        if not event.source_name:
-            event.source_name = self.SOURCE_NAME
-
-        return event
+        """HTTP GET of ``SOURCE_URL`` via the shared fetch helper."""
+        return fetch_url(self.SOURCE_URL, self.SOURCE_NAME, self.MAX_BYTES)
+
+    def _parse_and_enrich(self, html: str) -> List[NewsEvent]:
+        """Parse *html*, drop repeated ids and enrich the remaining events."""
+        events = self.parse(html)
+        # Drop same-id repeats (e.g. re-rendered live-blog entries) before enriching
+        unique: dict[str, NewsEvent] = {}
+        for ev in events:
+            unique.setdefault(ev.id, ev)
+        events = list(unique.values())
+        for ev in events:
+            if not ev.source_name:
+                ev.source_name = self.SOURCE_NAME
+        enrich_events(events)
+        return events
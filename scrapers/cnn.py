@@ -7,10 +7,16 @@ from __future__ import annotations
 from datetime import datetime, timezone
 from typing import List
 
-from bs4 import BeautifulSoup
+from lxml import etree
 
 from models.events import NewsEvent
-from scrapers.base import BaseScraper
+from scrapers.base import (
+    ARTICLES,
+    BaseScraper,
+    element_text,
+    parse_html,
+    scan_entry,
+)
 
 
 class CNNScraper(BaseScraper):
@@ -20,46 +26,48 @@ class CNNScraper(BaseScraper):
         "israel-iran-attack-02-28-26-hnk-intl"
     )
 
+    # Live-entry containers (XPath union, document order)
+    _ENTRIES = etree.XPath(
+        "//*[contains(@class, 'live-story')] | "
+        "//*[@data-type='live-story'] | "
+        "//*[contains(@class, 'LiveStory')] | "
+        "//article[contains(@class, 'live')]"
+    )
+
     def parse(self, html: str) -> List[NewsEvent]:
-        soup = BeautifulSoup(html, "lxml")
+        tree = parse_html(html)
         events: List[NewsEvent] = []
 
-        entries = soup.select(
-            "[class*='live-story'], "
-            "[data-type='live-story'], "
-            "[class*='LiveStory'], "
-            "article[class*='live']"
-        )
+        entries = self._ENTRIES(tree)
 
         if not entries:
-            entries = soup.find_all("article")
+            entries = ARTICLES(tree)
 
         for entry in entries[:50]:
-            title_el = entry.find(["h2", "h3", "h4"])
-            title = title_el.get_text(strip=True) if title_el else ""
+            heading, paragraphs, time_el, a_tag = scan_entry(entry)
+            title = element_text(heading) if heading is not None else ""
 
-            paragraphs = entry.find_all("p")
-            summary = " ".join(p.get_text(strip=True) for p in paragraphs[:3])
+            summary = " ".join(element_text(p) for p in paragraphs)
 
             if not title and not summary:
                 continue
             if not title:
                 title = summary[:120] + ("…" if len(summary) > 120 else "")
 
-            time_el = entry.find("time")
             timestamp = datetime.now(timezone.utc)
-            if time_el:
+            if time_el is not None:
                 dt_str = time_el.get("datetime", "")
                 if dt_str:
                     try:
                         timestamp = datetime.fromisoformat(dt_str.replace("Z", "+00:00"))
+                        if timestamp.tzinfo is None:
+                            timestamp = timestamp.replace(tzinfo=timezone.utc)
                     except ValueError:
                         pass
 
             link = ""
-            a_tag = entry.find("a", href=True)
-            if a_tag:
-                href = a_tag["href"]
+            if a_tag is not None:
+                href = a_tag.get("href")
                 link = href if href.startswith("http") else f"https://www.cnn.com{href}"
 
             events.append(
@@ -69,7 +77,6 @@ class CNNScraper(BaseScraper):
                     source_name=self.SOURCE_NAME,
                     source_url=link or self.SOURCE_URL,
                     timestamp=timestamp,
-                    raw_text=f"{title} {summary}",
                 )
             )
 
@@ -0,0 +1,25 @@
+"""Shared crisis-relevance filter for general news feeds."""
+
+from __future__ import annotations
+
+# Keywords that indicate Iran/Israel/Middle East crisis relevance.
+# Matched as lowercase substrings, so "strike" also covers "airstrike".
+CRISIS_KEYWORDS = (
+    "iran", "israel", "tehran", "idf", "hamas", "hezbollah", "gaza",
+    "strike", "missile", "bomb", "attack", "military",
+    "nuclear", "irgc", "pentagon", "jerusalem", "netanyahu", "khamenei",
+    "middle east", "war", "conflict", "ceasefire", "escalat",
+)
+
+
+def is_crisis_related(entry) -> bool:
+    """Return True if a feed entry's title or summary mentions the crisis."""
+    # Plain substring tests beat a compiled alternation here: str.__contains__
+    # uses a fast search, and CPython's re has no multi-literal prefilter.
+    # Titles are short and usually decide it, so the (longer) summary is
+    # only lowercased and scanned when the title has no keyword.
+    title = entry.get("title", "").lower()
+    if any(kw in title for kw in CRISIS_KEYWORDS):
+        return True
+    summary = entry.get("summary", "").lower()
+    return any(kw in summary for kw in CRISIS_KEYWORDS)
@@ -1,26 +1,124 @@
 """
-Base RSS scraper using feedparser.
+Base RSS scraper using lxml, with feedparser as a fallback.
 
 Parses RSS/Atom feeds and converts entries into NewsEvent objects.
-Reuses the HTTP fetching and enrichment logic from BaseScraper.
+Fetches through the shared ``fetch_url`` helper from scrapers.base.
 """
 
 from __future__ import annotations
 
+import re
 from datetime import datetime, timezone
-from typing import List, Optional
+from email.utils import parsedate_to_datetime
+from io import BytesIO
+from typing import Iterator, List, Optional
 
 import feedparser
 from dateutil import parser as dateparser
+from lxml import etree
 
 from config.settings import SOURCES_BY_NAME
 from models.events import NewsEvent
-from processing.categorizer import categorize_event, estimate_severity
-from processing.geocoder import extract_primary_location
+from processing.pipeline import enrich_events
+from scrapers.base import fetch_url, parse_once
 from utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Namespaces whose title/link/description/date children describe the
+# entry itself (plain RSS 2.0, RSS 1.0 and Atom).  Anything else –
+# media:title, itunes:summary, … – is ignored like feedparser does.
+_ENTRY_NAMESPACES = frozenset({
+    "",
+    "http://purl.org/rss/1.0/",
+    "http://www.w3.org/2005/Atom",
+    "http://purl.org/atom/ns#",
+})
+_CONTENT_NS = "http://purl.org/rss/1.0/modules/content/"
+_DC_NS = "http://purl.org/dc/elements/1.1/"
+
+# feedparser's sanitizer drops script/style bodies, not just the tags
+_SCRIPT_RE = re.compile(r"<(script|style)\b.*?</\1\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+
+def iter_feed_entries(body: str, limit: int = 50) -> Iterator[dict]:
+    """
+    Stream up to *limit* RSS/Atom entries out of *body*.
+
+    Yields feedparser-style dicts holding only the keys the scrapers
+    read: title, summary, link, published and updated.  Parsing stops
+    as soon as *limit* entries have been produced.
+
+    Raises ``etree.XMLSyntaxError`` if the feed is not well-formed.
+    libxml2's recovery mode is deliberately not used: after one undefined
+    HTML entity such as ``&nbsp;`` it drops every later ``&amp;``/``&lt;``
+    in the document, silently mangling titles and summaries.
+    """
+    context = etree.iterparse(
+        BytesIO(body.encode("utf-8")),
+        events=("end",),
+        tag=("{*}item", "{*}entry"),
+        encoding="utf-8",
+        recover=False,
+        resolve_entities=False,
+        no_network=True,
+    )
+    count = 0
+    for _, elem in context:
+        yield _element_to_entry(elem)
+        count += 1
+        if count >= limit:
+            break
+        # Free the finished entry and any siblings already walked past
+        elem.clear()
+        while elem.getprevious() is not None:
+            del elem.getparent()[0]
+
+
+def _element_to_entry(elem) -> dict:
+    """Collect the fields of one <item>/<entry> element."""
+    entry: dict = {}
+    description = atom_summary = content = None
+    for child in elem:
+        tag = child.tag
+        if not isinstance(tag, str):  # comments, processing instructions
+            continue
+        ns, _, name = tag[1:].rpartition("}") if tag[0] == "{" else ("", "", tag)
+        if ns in _ENTRY_NAMESPACES:
+            if name == "title":
+                entry.setdefault("title", "".join(child.itertext()).strip())
+            elif name == "description":
+                if description is None:
+                    description = "".join(child.itertext())
+            elif name == "summary":
+                if atom_summary is None:
+                    atom_summary = "".join(child.itertext())
+            elif name == "content":
+                if content is None:
+                    content = "".join(child.itertext())
+            elif name == "link" and "link" not in entry:
+                if child.get("rel") in (None, "alternate"):
+                    link = (child.text or "").strip() or child.get("href", "")
+                    if link:
+                        entry["link"] = link
+            elif name in ("pubDate", "published", "issued"):
+                entry.setdefault("published", (child.text or "").strip())
+            elif name in ("updated", "modified"):
+                entry.setdefault("updated", (child.text or "").strip())
+        elif ns == _CONTENT_NS and name == "encoded":
+            if content is None:
+                content = "".join(child.itertext())
+        elif ns == _DC_NS and name == "date":
+            entry.setdefault("updated", (child.text or "").strip())
+    # Like feedparser, a present-but-empty <description> still wins
+    for text in (description, atom_summary, content):
+        if text is not None:
+            entry["summary"] = text.strip()
+            break
+    return entry
+
 
 class RSSBaseScraper:
     """
@@ -36,22 +134,10 @@ class RSSBaseScraper:
     def scrape(self) -> List[NewsEvent]:
         """Fetch and parse the RSS feed, returning enriched events."""
         try:
-            feed = feedparser.parse(self.SOURCE_URL)
-            if feed.bozo and not feed.entries:
-                logger.warning("%s – feed parse error: %s", self.SOURCE_NAME, feed.bozo_exception)
+            body = fetch_url(self.SOURCE_URL, self.SOURCE_NAME)
+            if not body:
                 return []
-
-            events: list[NewsEvent] = []
-            for entry in feed.entries[:50]:  # cap per-source
-                if not self._filter_entry(entry):
-                    continue
-                ev = self._entry_to_event(entry)
-                if ev:
-                    events.append(self._enrich(ev))
-
-            logger.info("%s – %d entries parsed", self.SOURCE_NAME, len(events))
-            return events
-
+            return parse_once(self.SOURCE_NAME, body, self._parse_feed)
         except Exception as exc:
             logger.error("%s RSS scrape failed: %s", self.SOURCE_NAME, exc)
             return []
@@ -68,6 +154,41 @@ class RSSBaseScraper:
     # Internal
     # ------------------------------------------------------------------
 
+    def _parse_feed(self, body: str) -> List[NewsEvent]:
+        """Parse a feed body into enriched events."""
+        try:
+            entries = list(iter_feed_entries(body, limit=50))  # cap per-source
+        except etree.LxmlError:
+            entries = []
+        if not entries:
+            # Not well-formed XML (HTML entities in RSS are common) or
+            # genuinely empty – let the lenient feedparser have a go
+            # before giving up
+            feed = feedparser.parse(body)
+            if feed.bozo and not feed.entries:
+                logger.warning("%s – feed parse error: %s", self.SOURCE_NAME, feed.bozo_exception)
+                return []
+            entries = feed.entries[:50]
+
+        events: list[NewsEvent] = []
+        seen_titles: set[str] = set()
+        for entry in entries:
+            # Same title + source means same event id – skip repeats
+            # before paying for parsing and enrichment
+            title_key = entry.get("title", "").lower().strip()
+            if title_key in seen_titles:
+                continue
+            seen_titles.add(title_key)
+            if not self._filter_entry(entry):
+                continue
+            ev = self._entry_to_event(entry)
+            if ev:
+                events.append(ev)
+        enrich_events(events)
+
+        logger.info("%s – %d entries parsed", self.SOURCE_NAME, len(events))
+        return events
+
     def _entry_to_event(self, entry) -> Optional[NewsEvent]:
         """Convert a feedparser entry dict into a NewsEvent."""
         title = entry.get("title", "").strip()
@@ -76,9 +197,9 @@ class RSSBaseScraper:
 
         summary = entry.get("summary", "") or entry.get("description", "")
         # Strip HTML tags from summary
-        import re
-        summary = re.sub(r"<[^>]+>", " ", summary).strip()
-        summary = re.sub(r"\s+", " ", summary)[:300]
+        if "<" in summary:
+            summary = _TAG_RE.sub(" ", _SCRIPT_RE.sub(" ", summary))
+        summary = _WS_RE.sub(" ", summary.strip())[:300]
 
         link = entry.get("link", "")
 
@@ -101,28 +222,28 @@ class RSSBaseScraper:
         """Extract and parse timestamp from an RSS entry."""
         raw = entry.get("published") or entry.get("updated") or ""
         if raw:
-            try:
-                return dateparser.parse(raw)
-            except (ValueError, TypeError):
-                pass
+            # RSS pubDate is RFC 822 and Atom / dc:date are ISO 8601; both
+            # have stdlib parsers, so dateutil only sees the odd formats
+            dt = None
+            if raw[0].isdigit():
+                try:
+                    dt = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+                except ValueError:
+                    pass
+            if dt is None:
+                try:
+                    dt = parsedate_to_datetime(raw)
+                except (ValueError, TypeError):
+                    pass
+            if dt is None:
+                try:
+                    dt = dateparser.parse(raw)
+                except (ValueError, TypeError):
+                    pass
+            if dt is not None:
+                # Feeds that omit the offset ("-0000" included) are read as UTC;
+                # NewsEvent rejects naive timestamps
+                if dt.tzinfo is None:
+                    dt = dt.replace(tzinfo=timezone.utc)
+                return dt
         return datetime.now(timezone.utc)
-
-    def _enrich(self, event: NewsEvent) -> NewsEvent:
-        """Fill in event_type, severity, and geolocation if missing."""
-        if event.event_type.value == "other":
-            event.event_type = categorize_event(event.title, event.summary)
-        if event.severity == 3:
-            event.severity = estimate_severity(event.title, event.summary)
-
-        if not event.has_location:
-            text = f"{event.title} {event.summary}"
-            loc = extract_primary_location(text)
-            if loc:
-                event.location_name = loc[0]
-                event.latitude = loc[1]
-                event.longitude = loc[2]
-
-        if not event.source_name:
-            event.source_name = self.SOURCE_NAME
-
-        return event
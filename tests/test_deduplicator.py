@@ -0,0 +1,65 @@
+"""Tests for the time windows and thresholds in processing.deduplicator."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.events import NewsEvent
+from processing.deduplicator import deduplicate
+
+T0 = datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+TITLE = "Israeli airstrike hits fuel depot near Tehran"
+
+
+def _ev(source, minutes, title=TITLE, summary=""):
+    return NewsEvent(
+        title=title,
+        source_name=source,
+        summary=summary,
+        timestamp=T0 + timedelta(minutes=minutes),
+    )
+
+
+@pytest.mark.parametrize("minutes, dup", [(30, True), (31, False)])
+def test_cross_source_window_is_30_minutes_inclusive(minutes, dup):
+    kept = deduplicate([_ev("BBC", 0), _ev("CNN", minutes)])
+    assert len(kept) == (1 if dup else 2)
+
+
+@pytest.mark.parametrize("minutes, dup", [(120, True), (121, False)])
+def test_same_source_window_is_120_minutes_inclusive(minutes, dup):
+    kept = deduplicate([_ev("BBC", 0), _ev("BBC", minutes)])
+    assert len(kept) == (1 if dup else 2)
+
+
+def test_window_is_symmetric_in_time():
+    kept = deduplicate([_ev("CNN", 30), _ev("BBC", 0)])
+    assert len(kept) == 1
+
+
+def test_cross_source_threshold_is_looser_than_same_source():
+    # ~0.77 similar: passes the 0.65 cross-source bar, not the 0.85 same-source one
+    other = "Israeli airstrike hits Tehran fuel depot overnight"
+    assert len(deduplicate([_ev("BBC", 0), _ev("CNN", 5, title=other)])) == 1
+    assert len(deduplicate([_ev("BBC", 0), _ev("BBC", 5, title=other)])) == 2
+
+
+def test_unrelated_titles_are_kept():
+    kept = deduplicate([_ev("BBC", 0), _ev("CNN", 1, title="UN convenes emergency session")])
+    assert len(kept) == 2
+
+
+def test_longer_summary_wins():
+    short, detailed = _ev("BBC", 0, summary="Blast."), _ev("CNN", 10, summary="Blast at depot, fires.")
+    assert deduplicate([short, detailed]) == [detailed]
+    assert deduplicate([detailed, short]) == [detailed]
+
+
+def test_pairs_beyond_the_widest_window_are_kept():
+    # 240 min apart: beyond even the wider same-source window
+    kept = deduplicate([_ev("BBC", 0), _ev("BBC", 240)])
+    assert len(kept) == 2
+
+
+def test_empty_input():
+    assert deduplicate([]) == []
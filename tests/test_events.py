@@ -0,0 +1,66 @@
+"""Tests for NewsEvent construction and validation."""
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from models.events import EventType, NewsEvent
+
+TS = datetime(2026, 10, 15, 12, 0, tzinfo=timezone.utc)
+
+
+def test_naive_timestamp_is_rejected():
+    with pytest.raises(ValueError):
+        NewsEvent(title="t", source_name="s", timestamp=datetime(2026, 10, 15, 12, 0))
+
+
+def test_aware_timestamp_sets_epoch():
+    tz = timezone(timedelta(hours=3, minutes=30))
+    ev = NewsEvent(title="t", source_name="s", timestamp=TS.astimezone(tz))
+    assert ev.epoch == TS.timestamp()
+
+
+def test_coordinates_are_coerced_to_float():
+    ev = NewsEvent(title="t", source_name="s", timestamp=TS, latitude="35.69", longitude=51)
+    assert (ev.latitude, ev.longitude) == (35.69, 51.0)
+    assert isinstance(ev.longitude, float)
+    assert ev.has_location
+
+
+def test_coordinates_are_clamped_to_valid_ranges():
+    ev = NewsEvent(title="t", source_name="s", timestamp=TS, latitude=95, longitude=-190.5)
+    assert (ev.latitude, ev.longitude) == (90.0, -180.0)
+
+
+def test_missing_coordinates_stay_none():
+    ev = NewsEvent(title="t", source_name="s", timestamp=TS)
+    assert ev.latitude is None and ev.longitude is None
+    assert not ev.has_location
+
+
+def test_bad_coordinate_is_rejected():
+    with pytest.raises(ValueError):
+        NewsEvent(title="t", source_name="s", timestamp=TS, latitude="north")
+
+
+@pytest.mark.parametrize("given, expected", [(0, 1), (3, 3), (9, 5), (4.7, 4), ("2", 2)])
+def test_severity_is_clamped(given, expected):
+    assert NewsEvent(title="t", source_name="s", timestamp=TS, severity=given).severity == expected
+
+
+def test_event_type_is_coerced():
+    ev = NewsEvent(title="t", source_name="s", timestamp=TS, event_type="missile")
+    assert ev.event_type is EventType.MISSILE
+
+
+def test_id_depends_on_normalised_title_and_source_only():
+    a = NewsEvent(title="  Strike Near Tehran ", source_name="BBC", timestamp=TS)
+    b = NewsEvent(title="strike near tehran", source_name="BBC", timestamp=TS + timedelta(hours=2))
+    c = NewsEvent(title="strike near tehran", source_name="CNN", timestamp=TS)
+    assert a.title_norm == "strike near tehran"
+    assert a.id == b.id != c.id
+    assert len(a.id) == 16
+
+
+def test_explicit_id_is_kept():
+    assert NewsEvent(title="t", source_name="s", timestamp=TS, id="abc").id == "abc"
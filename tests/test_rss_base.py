@@ -0,0 +1,116 @@
+"""Tests for the lxml RSS/Atom fast path in scrapers.rss_base."""
+
+from datetime import timezone
+
+import pytest
+
+import scrapers.rss_base as rss_base
+from scrapers.rss_base import RSSBaseScraper, iter_feed_entries
+
+
+class _FeedScraper(RSSBaseScraper):
+    SOURCE_NAME = "Test Feed"
+    SOURCE_URL = "https://example.com/feed.xml"
+
+
+RSS_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/"
+     xmlns:dc="http://purl.org/dc/elements/1.1/"
+     xmlns:media="http://search.yahoo.com/mrss/">
+<channel>
+  <title>Example</title>
+  <item>
+    <title>Israeli airstrike hits Tehran &amp; Isfahan &#8211; reports</title>
+    <media:title>Ignored media title</media:title>
+    <link>https://example.com/a</link>
+    <description>&lt;p&gt;Explosions &amp;amp; sirens&lt;/p&gt;&lt;script&gt;x()&lt;/script&gt;</description>
+    <pubDate>Thu, 15 Oct 2026 10:00:00 GMT</pubDate>
+  </item>
+  <item>
+    <title><![CDATA[Iran fires missiles at <b>Israel</b>]]></title>
+    <link>https://example.com/b</link>
+    <description></description>
+    <content:encoded><![CDATA[<p>Ignored: empty description wins</p>]]></content:encoded>
+    <dc:date>2026-10-15T09:30:00+03:30</dc:date>
+  </item>
+</channel>
+</rss>
+"""
+
+ATOM_FEED = """<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example</title>
+  <entry>
+    <title>Hezbollah drone alert in northern Israel</title>
+    <link rel="self" href="https://example.com/self"/>
+    <link rel="alternate" href="https://example.com/c"/>
+    <summary>Sirens &lt;b&gt;sounded&lt;/b&gt; overnight</summary>
+    <updated>2026-10-15T08:00:00Z</updated>
+  </entry>
+</feed>
+"""
+
+# One undefined HTML entity makes libxml2's recovery mode drop every later
+# predefined entity in the document
+ENTITY_FEED = """<?xml version="1.0"?>
+<rss version="2.0"><channel><title>t</title>
+<item><title>A&nbsp;B &amp; C</title><description>&lt;p&gt;Hit &amp;amp; run&lt;/p&gt;</description>
+  <pubDate>Thu, 15 Oct 2026 10:00:00 GMT</pubDate></item>
+<item><title>Second &amp; item</title><pubDate>Thu, 15 Oct 2026 11:00:00 GMT</pubDate></item>
+</channel></rss>
+"""
+
+
+def _event_fields(events):
+    return [
+        (ev.id, ev.title, ev.summary, ev.source_url, ev.timestamp, ev.event_type)
+        for ev in events
+    ]
+
+
+def _parse_with_feedparser(monkeypatch, body):
+    def _unavailable(body, limit=50):
+        raise rss_base.etree.XMLSyntaxError("forced fallback", None, 0, 0)
+        yield  # pragma: no cover
+
+    with monkeypatch.context() as m:
+        m.setattr(rss_base, "iter_feed_entries", _unavailable)
+        return _FeedScraper()._parse_feed(body)
+
+
+@pytest.mark.parametrize("body", [RSS_FEED, ATOM_FEED, ENTITY_FEED], ids=["rss", "atom", "entity"])
+def test_lxml_path_matches_feedparser(monkeypatch, body):
+    expected = _parse_with_feedparser(monkeypatch, body)
+    assert expected
+    assert _event_fields(_FeedScraper()._parse_feed(body)) == _event_fields(expected)
+
+
+def test_undefined_entity_does_not_mangle_later_entities():
+    events = _FeedScraper()._parse_feed(ENTITY_FEED)
+    assert [ev.title for ev in events] == ["A\xa0B & C", "Second & item"]
+    assert events[0].summary == "Hit &amp; run"
+
+
+def test_iter_feed_entries_rejects_malformed_feed():
+    with pytest.raises(rss_base.etree.XMLSyntaxError):
+        list(iter_feed_entries(ENTITY_FEED))
+
+
+def test_iter_feed_entries_honours_limit():
+    items = "".join(f"<item><title>Item {i}</title></item>" for i in range(10))
+    body = f"<rss><channel>{items}</channel></rss>"
+    assert [e["title"] for e in iter_feed_entries(body, limit=3)] == [
+        "Item 0", "Item 1", "Item 2",
+    ]
+
+
+@pytest.mark.parametrize("raw", [
+    "2026-10-15T10:00:00",
+    "Thu, 15 Oct 2026 10:00:00 -0000",
+    "October 15 2026 10:00",
+])
+def test_offsetless_dates_are_read_as_utc(raw):
+    ts = _FeedScraper()._parse_timestamp({"published": raw})
+    assert ts.tzinfo is not None
+    assert ts.utcoffset() == timezone.utc.utcoffset(None)
+    assert (ts.hour, ts.minute) == (10, 0)
@@ -16,6 +16,7 @@ import html
 import json
 import math
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List
 
 from config.settings import (
@@ -101,6 +102,18 @@ _TYPE_ICONS = {
     ),
 }
 
+# Per-type pin colour and icon, resolved once rather than per event/button
+_TYPE_HEX = {
+    et: _CSS_COLORS.get(cfg["color"], "#95a5a6") for et, cfg in EVENT_TYPE_CONFIG.items()
+}
+_TYPE_ICON_SVG = {
+    et: _TYPE_ICONS.get(cfg["label"], _TYPE_ICONS["Other"]) for et, cfg in EVENT_TYPE_CONFIG.items()
+}
+
+# Pin icons by type label for the map script: shipped once per page
+# instead of repeating the SVG inside every marker's JSON row
+_TYPE_ICONS_JSON = json.dumps(_TYPE_ICONS, ensure_ascii=False)
+
 # External-link SVG icon
 _EXT_ICON_SVG = (
     '<svg xmlns="http://www.w3.org/2000/svg" width="12" height="12" '
@@ -142,11 +155,12 @@ def build_dashboard_html(
 ) -> str:
     """Build complete HTML page with Leaflet map + news feed side by side."""
     now = datetime.now(timezone.utc)
+    now_ts = now.timestamp()
     feed_items = all_events[:MAX_NEWS_FEED_ITEMS]
 
     # Filter map events to last N hours only
-    max_age_min = MAP_MAX_AGE_HOURS * 60
-    recent_geo = [ev for ev in geo_events if ev.age_minutes(now) <= max_age_min]
+    cutoff_ts = now_ts - MAP_MAX_AGE_HOURS * 3600
+    recent_geo = [ev for ev in geo_events if ev.epoch >= cutoff_ts]
 
     # Build marker data as JSON for Leaflet
     markers_json = json.dumps([
@@ -156,14 +170,13 @@ def build_dashboard_html(
             "lng": ev.longitude,
             "title": _esc(ev.title),
             "type_label": ev.display_config["label"],
-            "color": _CSS_COLORS.get(ev.display_config["color"], "#95a5a6"),
-            "icon_svg": _TYPE_ICONS.get(ev.display_config["label"], _TYPE_ICONS["Other"]),
+            "color": _TYPE_HEX[ev.event_type],
             "source": ev.source_name,
-            "age": _format_age(ev.age_minutes(now)),
+            "age": _format_age((now_ts - ev.epoch) / 60.0),
             "summary": _esc((ev.summary or "")[:150]),
             "source_url": ev.source_url or "",
             "location": ev.location_name or "",
-            "timestamp_ms": int(ev.timestamp.timestamp() * 1000),
+            "timestamp_ms": int(ev.epoch * 1000),
         }
         for ev in recent_geo
     ], ensure_ascii=False)
@@ -180,9 +193,8 @@ def build_dashboard_html(
         cnt = map_type_counts.get(label, 0)
         if cnt <= 0:
             continue
-        color = _CSS_COLORS.get(cfg["color"], "#95a5a6")
-        icon_svg = _TYPE_ICONS.get(label, _TYPE_ICONS["Other"])
-        mini = _mini_pin_svg(color, icon_svg, size=12)
+        color = _TYPE_HEX[etype]
+        mini = _mini_pin_svg(color, _TYPE_ICON_SVG[etype], size=12)
         map_filter_buttons.append(
             f'<button class="filter-btn active" data-type="{label}" '
             f'style="--btn-color:{color};">{mini} {label} <span class="fbtn-count">{cnt}</span></button>'
@@ -200,9 +212,8 @@ def build_dashboard_html(
         cnt = feed_type_counts.get(label, 0)
         if cnt <= 0:
             continue
-        color = _CSS_COLORS.get(cfg["color"], "#95a5a6")
-        icon_svg = _TYPE_ICONS.get(label, _TYPE_ICONS["Other"])
-        mini = _mini_pin_svg(color, icon_svg, size=12)
+        color = _TYPE_HEX[etype]
+        mini = _mini_pin_svg(color, _TYPE_ICON_SVG[etype], size=12)
         feed_filter_buttons.append(
             f'<button class="feed-filter-btn active" data-type="{label}" '
             f'style="--btn-color:{color};">{mini} {label} <span class="fbtn-count">{cnt}</span></button>'
@@ -211,7 +222,7 @@ def build_dashboard_html(
     feed_filter_bar_html = feed_all_btn + '<span style="width:1px;height:16px;background:rgba(255,255,255,0.15);align-self:center;"></span>' + ''.join(feed_filter_buttons)
 
     # Build feed cards HTML
-    cards_html = "\n".join(_render_card(ev, now) for ev in feed_items)
+    cards_html = "\n".join(_render_card(ev, now_ts) for ev in feed_items)
 
     # Escape summary for safe HTML embedding
     summary_html = _esc(summary_text) if summary_text else ""
@@ -719,6 +730,7 @@ def build_dashboard_html(
 
     // ── Spread overlapping markers naturally ─────────────────────
     var markersData = {markers_json};
+    var typeIcons = {_TYPE_ICONS_JSON};
     var markerLookup = {{}};
     var markersByType = {{}};
 
@@ -748,7 +760,7 @@ def build_dashboard_html(
             '<div class="pin-marker">' +
             '<div class="pin-body" style="background:' + d.color + ';">' +
             '<svg class="pin-icon" viewBox="0 0 24 24" xmlns="http://www.w3.org/2000/svg">' +
-            d.icon_svg +
+            (typeIcons[d.type_label] || typeIcons.Other) +
             '</svg>' +
             '</div>' +
             '<div class="pin-dot" style="background:' + d.color + ';"></div>' +
@@ -1229,18 +1241,17 @@ def build_dashboard_html(
 
 # ── Card renderer ─────────────────────────────────────────────────────────
 
-def _render_card(event: NewsEvent, now: datetime) -> str:
+def _render_card(event: NewsEvent, now_ts: float) -> str:
     """Render a single news card with mini pin icon in type badge."""
     cfg = event.display_config
-    age_min = event.age_minutes(now)
+    age_min = (now_ts - event.epoch) / 60.0
     is_recent = age_min < EVENT_RECENT_MINUTES
     recent_class = " recent" if is_recent else ""
 
-    type_color = _CSS_COLORS.get(cfg["color"], "#95a5a6")
-    icon_svg = _TYPE_ICONS.get(cfg["label"], _TYPE_ICONS["Other"])
+    type_color = _TYPE_HEX[event.event_type]
 
     # Mini pin SVG next to the type label — matches map markers exactly
-    mini = _mini_pin_svg(type_color, icon_svg, size=14)
+    mini = _mini_pin_svg(type_color, _TYPE_ICON_SVG[event.event_type], size=14)
 
     type_indicator = (
         f'<span class="type-indicator" '
@@ -1304,9 +1315,8 @@ def _render_stats(events: List[NewsEvent]) -> str:
     for etype, cfg in EVENT_TYPE_CONFIG.items():
         c = counts.get(etype, 0)
         if c > 0:
-            type_color = _CSS_COLORS.get(cfg["color"], "#95a5a6")
-            icon_svg = _TYPE_ICONS.get(cfg["label"], _TYPE_ICONS["Other"])
-            mini = _mini_pin_svg(type_color, icon_svg, size=14)
+            type_color = _TYPE_HEX[etype]
+            mini = _mini_pin_svg(type_color, _TYPE_ICON_SVG[etype], size=14)
             chips.append(
                 f'<span class="stat-chip">'
                 f'{mini}'
@@ -1353,6 +1363,7 @@ def _format_age(minutes: float) -> str:
     return f"{int(hours / 24)}d ago"
 
 
+@lru_cache(maxsize=32)
 def _hex_to_rgb(hex_color: str) -> str:
     h = hex_color.lstrip("#")
     return ",".join(str(int(h[i:i+2], 16)) for i in (0, 2, 4))
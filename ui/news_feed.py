@@ -10,6 +10,7 @@ from __future__ import annotations
 
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List
 
 from config.settings import MAX_NEWS_FEED_ITEMS, EVENT_RECENT_MINUTES, SOURCES_BY_NAME
@@ -187,6 +188,7 @@ def _format_age(minutes: float) -> str:
     return f"{int(hours / 24)}d ago"
 
 
+@lru_cache(maxsize=32)
 def _hex_to_rgb(hex_color: str) -> str:
     """Convert hex colour to 'r,g,b' string for CSS rgba()."""
     h = hex_color.lstrip("#")
@@ -5,29 +5,46 @@ Used for HTTP response caching in scrapers.
 
 from __future__ import annotations
 
+import threading
 import time
+from collections import OrderedDict
 from typing import Any, Optional
 
 
 class TTLCache:
-    """Dictionary-like cache where entries expire after *ttl* seconds."""
+    """
+    Dictionary-like cache where entries expire after *ttl* seconds.
 
-    def __init__(self, ttl: int = 55) -> None:
+    Holds at most *maxsize* entries; once full, the least recently used
+    entry is evicted to make room.  Safe to share between scraper threads:
+    ``get`` reorders entries too, so every access takes the lock.
+    """
+
+    def __init__(self, ttl: int = 55, maxsize: int = 64) -> None:
         self._ttl = ttl
-        self._store: dict[str, tuple[float, Any]] = {}
+        self._maxsize = maxsize
+        self._store: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
 
     def get(self, key: str) -> Optional[Any]:
-        entry = self._store.get(key)
-        if entry is None:
-            return None
-        ts, value = entry
-        if time.time() - ts > self._ttl:
-            del self._store[key]
-            return None
-        return value
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            ts, value = entry
+            if time.monotonic() - ts > self._ttl:
+                del self._store[key]
+                return None
+            self._store.move_to_end(key)
+            return value
 
     def set(self, key: str, value: Any) -> None:
-        self._store[key] = (time.time(), value)
+        with self._lock:
+            self._store[key] = (time.monotonic(), value)
+            self._store.move_to_end(key)
+            while len(self._store) > self._maxsize:
+                self._store.popitem(last=False)
 
     def clear(self) -> None:
-        self._store.clear()
+        with self._lock:
+            self._store.clear()